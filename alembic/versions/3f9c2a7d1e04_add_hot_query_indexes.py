@@ -0,0 +1,38 @@
+"""add hot query indexes
+
+Revision ID: 3f9c2a7d1e04
+Revises: 8b1d64454b96
+Create Date: 2026-10-17 10:02:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9c2a7d1e04'
+down_revision: Union[str, Sequence[str], None] = '8b1d64454b96'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # users.username == ? (로그인, 호스트 조회, 인증 사용자 조회)
+    op.create_index('ix_users_username', 'users', ['username'], unique=False)
+    # time_slots.calendar_id == ? (+ start_time 범위, 겹침 검사)
+    op.create_index('ix_time_slots_calendar_id_start_time', 'time_slots', ['calendar_id', 'start_time'], unique=False)
+    # bookings.guest_id == ? ORDER BY when DESC, created_at DESC
+    op.create_index('ix_bookings_guest_id_when_created_at', 'bookings', ['guest_id', 'when', 'created_at'], unique=False)
+    # bookings.time_slot_id == ? AND when ... (중복 예약, 캘린더별 예약 목록)
+    op.create_index('ix_bookings_time_slot_id_when', 'bookings', ['time_slot_id', 'when'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_bookings_time_slot_id_when', table_name='bookings')
+    op.drop_index('ix_bookings_guest_id_when_created_at', table_name='bookings')
+    op.drop_index('ix_time_slots_calendar_id_start_time', table_name='time_slots')
+    op.drop_index('ix_users_username', table_name='users')
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Union
 
 from sqlmodel import SQLModel, Field, Relationship, func
 from pydantic import AwareDatetime, EmailStr, model_validator
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import Index, UniqueConstraint
 from sqlalchemy_utc import UtcDateTime
 
 if TYPE_CHECKING:
@@ -16,6 +16,7 @@ class User(SQLModel, table=True):
     __tablename__ = "users"
     __table_args__ = (
         UniqueConstraint("email", name="uq_email"),
+        Index("ix_users_username", "username"),
     )
 
     id: int = Field(default=None, primary_key=True)
@@ -1,11 +1,15 @@
 from fastapi import APIRouter, status, Query, HTTPException, UploadFile, File
+from datetime import date, datetime
 from typing import Annotated
 from sqlmodel import select, and_, func, true, extract
+from sqlalchemy import literal, tuple_
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.sql import Select
 from appserver.apps.account.models import User
 from appserver.apps.calendar.models import Calendar, TimeSlot
 from appserver.db import DbSessionDep
 from appserver.apps.account.deps import CurrentUserOptionalDep, CurrentUserDep
+from appserver.libs.cursor import encode_cursor, decode_cursor, KeysetDateTime
 from .models import Booking
 from .deps import UtcNow
 from .enums import AttendanceStatus
@@ -13,12 +17,12 @@ from .exceptions import (
     CalendarNotFoundError, HostNotFoundError, CalendarAlreadyExistsError,
     GuestPermissionError, TimeSlotOverlapError, TimeSlotNotFoundError,
     SelfBookingError, PastDateBookingError, DuplicateBookingError,
-    InvalidWeekdayError, PastBookingUpdateError,
+    InvalidWeekdayError, PastBookingUpdateError, InvalidCursorError,
 )
 from .schemas import (
     CalendarDetailOut, CalendarOut, CalendarCreateIn,
     CalendarUpdateIn, TimeSlotCreateIn, TimeSlotOut,
-    BookingCreateIn, BookingOut, SimpleBookingOut,
+    BookingCreateIn, BookingOut, BookingPageOut, SimpleBookingOut,
     HostBookingUpdateIn, GusetBookingUpdateIn, HostBookingStatusUpdateIn
 )
 
@@ -215,28 +219,78 @@ async def create_booking(
     return booking
 
 
+# 예약 목록의 정렬 키. 커서는 마지막 행의 이 값들을 담는다.
+BOOKING_KEYSET = (Booking.when, Booking.created_at, Booking.id)
+
+
+def paginate_bookings(
+    stmt: Select,
+    page: int | None,
+    page_size: int,
+    cursor: str | None,
+) -> Select:
+    """cursor 가 있거나 page 가 없으면 keyset, page 만 있으면 예전 방식(offset)으로 자른다."""
+    stmt = stmt.order_by(*(column.desc() for column in BOOKING_KEYSET))
+
+    if cursor is None and page is not None:
+        return stmt.offset((page - 1) * page_size).limit(page_size)
+
+    if cursor is not None:
+        try:
+            when, created_at, booking_id = decode_cursor(cursor)
+            when = date.fromisoformat(when)
+            created_at = datetime.fromisoformat(created_at)
+            booking_id = int(booking_id)
+        except (ValueError, TypeError) as exc:
+            raise InvalidCursorError() from exc
+        if created_at.tzinfo is None:
+            raise InvalidCursorError()
+
+        # (when, created_at, id) < (:when, :created_at, :id) 로 마지막 행 다음부터 찾는다.
+        stmt = stmt.where(
+            tuple_(*BOOKING_KEYSET)
+            < tuple_(literal(when, Booking.when.type), literal(created_at, KeysetDateTime()), literal(booking_id))
+        )
+
+    # 다음 페이지가 있는지 알기 위해 한 건 더 가져온다.
+    return stmt.limit(page_size + 1)
+
+
+def make_booking_page(bookings: list[Booking], page_size: int) -> BookingPageOut:
+    next_cursor = None
+    if len(bookings) > page_size:
+        bookings = bookings[:page_size]
+        last = bookings[-1]
+        next_cursor = encode_cursor([last.when, last.created_at, last.id])
+    return BookingPageOut(items=bookings, next_cursor=next_cursor)
+
+
 @router.get("/bookings",
             status_code=status.HTTP_200_OK,
-            response_model=list[BookingOut],
+            response_model=list[BookingOut] | BookingPageOut,
             )
 async def get_host_bookings_by_month(
     user: CurrentUserDep,
     session: DbSessionDep,
-    page: Annotated[int, Query(ge=1)],
-    page_size: Annotated[int, Query(ge=1, le=50)],
-) -> list[BookingOut]:
+    page: Annotated[int | None, Query(ge=1, description="예전 방식 페이지 번호. cursor 를 쓰면 무시")] = None,
+    page_size: Annotated[int, Query(ge=1, le=50)] = 20,
+    cursor: Annotated[str | None, Query(description="이전 응답의 next_cursor")] = None,
+) -> list[BookingOut] | BookingPageOut:
     if not user.is_host or user.calendar is None:
         raise HostNotFoundError()
     
     stmt = (
         select(Booking)
-        .where(Booking.time_slot.has(TimeSlot.calendar_id == user.calendar.id))
-        .order_by(Booking.when.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
+        .join(Booking.time_slot)
+        .where(TimeSlot.calendar_id == user.calendar.id)
     )
+    stmt = paginate_bookings(stmt, page, page_size, cursor)
     result = await session.execute(stmt)
-    return result.scalars().all()  
+    bookings = result.scalars().all()
+
+    if cursor is None and page is not None:
+        return bookings
+    return make_booking_page(bookings, page_size)
 
 @router.get(
             "/calendar/{host_username}/bookings",
@@ -257,7 +311,8 @@ async def host_calendar_bookings(
     
     stmt = (
         select(Booking)
-        .where(Booking.time_slot.has(TimeSlot.calendar_id == host.calendar.id))
+        .join(Booking.time_slot)
+        .where(TimeSlot.calendar_id == host.calendar.id)
         .where(extract("year", Booking.when) == year)
         .where(extract("month", Booking.when) == month)
         .order_by(Booking.when.desc())           
@@ -268,23 +323,23 @@ async def host_calendar_bookings(
 @router.get(
     "/guest-calendar/bookings",
     status_code=status.HTTP_200_OK,
-    response_model=list[BookingOut],
+    response_model=list[BookingOut] | BookingPageOut,
 )
 async def guest_calendar_bookings(
     user: CurrentUserDep,
     session: DbSessionDep,
-    page: Annotated[int, Query(ge=1)],
-    page_size: Annotated[int, Query(ge=1, le=50)],
-) -> list[BookingOut]:
-    stmt = (
-        select(Booking)
-        .where(Booking.guest_id == user.id)
-        .order_by(Booking.when.desc(), Booking.created_at.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-    )
+    page: Annotated[int | None, Query(ge=1, description="예전 방식 페이지 번호. cursor 를 쓰면 무시")] = None,
+    page_size: Annotated[int, Query(ge=1, le=50)] = 20,
+    cursor: Annotated[str | None, Query(description="이전 응답의 next_cursor")] = None,
+) -> list[BookingOut] | BookingPageOut:
+    stmt = select(Booking).where(Booking.guest_id == user.id)
+    stmt = paginate_bookings(stmt, page, page_size, cursor)
     result = await session.execute(stmt)
-    return result.scalars().all()
+    bookings = result.scalars().all()
+
+    if cursor is None and page is not None:
+        return bookings
+    return make_booking_page(bookings, page_size)
 
 @router.get(
     "/bookings/{booking_id}",
@@ -78,4 +78,11 @@ class PastBookingUpdateError(HTTPException):
         super().__init__(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail="당일과 지난 부킹은 변경할 수 없습니다."
-        )
\ No newline at end of file
+        )
+
+class InvalidCursorError(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="잘못된 페이지 커서입니다."
+        )
@@ -1,7 +1,7 @@
 from datetime import date, time, timezone, datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String
+from sqlalchemy import Index, String
 from sqlalchemy.dialects.postgresql import JSONB
 from pydantic import AwareDatetime
 from sqlalchemy_utc import UtcDateTime
@@ -54,6 +54,10 @@ class Calendar(SQLModel, table=True):
 
 class TimeSlot(SQLModel, table=True):
     __tablename__ = "time_slots"
+    __table_args__ = (
+        # 캘린더별 타임슬롯 조회와 시간대 겹침 검사
+        Index("ix_time_slots_calendar_id_start_time", "calendar_id", "start_time"),
+    )
 
     id: int = Field(default=None, primary_key=True)
     start_time: time
@@ -90,6 +94,12 @@ class TimeSlot(SQLModel, table=True):
 
 class Booking(SQLModel, table=True):
     __tablename__ = "bookings"
+    __table_args__ = (
+        # 게스트 예약 목록: guest_id == ? ORDER BY when DESC, created_at DESC
+        Index("ix_bookings_guest_id_when_created_at", "guest_id", "when", "created_at"),
+        # 타임슬롯별 예약 조회, 중복 예약 검사, 월별 예약 조회
+        Index("ix_bookings_time_slot_id_when", "time_slot_id", "when"),
+    )
 
     id: int = Field(default=None, primary_key=True)
     when: date
@@ -74,6 +74,10 @@ class BookingOut(SQLModel):
     created_at: AwareDatetime
     updated_at: AwareDatetime
 
+class BookingPageOut(SQLModel):
+    items: list[BookingOut]
+    next_cursor: str | None = Field(default=None, description="다음 페이지 커서. 마지막 페이지면 null")
+
 class SimpleBookingOut(SQLModel):
     when: date
     time_slot: TimeSlotOut
@@ -1,6 +1,10 @@
-from typing import Annotated
+import math
+import time
+from typing import Annotated, Any
 
-from fastapi import Depends
+from fastapi import Depends, Request, Response
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     async_sessionmaker,
@@ -8,12 +12,115 @@ from sqlalchemy.ext.asyncio import (
     AsyncEngine,
 )
 
+from appserver.settings import Settings, settings
 
-def create_engine(dsn: str):
-    return create_async_engine(
+
+def is_sqlite_dsn(dsn: str) -> bool:
+    return make_url(dsn).get_backend_name() == "sqlite"
+
+
+def is_sqlite_memory_dsn(dsn: str) -> bool:
+    """
+    >>> is_sqlite_memory_dsn("sqlite+aiosqlite:///:memory:")
+    True
+    >>> is_sqlite_memory_dsn("sqlite+aiosqlite:///./local.db")
+    False
+    """
+    url = make_url(dsn)
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def build_engine_options(dsn: str, config: Settings) -> dict[str, Any]:
+    """DSN 종류에 맞는 엔진 옵션을 만든다.
+
+    >>> options = build_engine_options("postgresql+asyncpg://localhost/meeting", Settings())
+    >>> options["pool_size"], options["connect_args"]["server_settings"]["timezone"]
+    (10, 'UTC')
+    >>> build_engine_options("sqlite+aiosqlite:///:memory:", Settings())
+    {'echo': False}
+    """
+    options: dict[str, Any] = {"echo": config.db_echo}
+
+    # 메모리 SQLite 는 StaticPool 하나의 커넥션만 쓰므로 풀 옵션을 받지 않는다.
+    if is_sqlite_memory_dsn(dsn):
+        return options
+
+    options.update(
+        pool_size=config.db_pool_size,
+        max_overflow=config.db_max_overflow,
+        pool_timeout=config.db_pool_timeout,
+        pool_recycle=config.db_pool_recycle,
+        pool_pre_ping=config.db_pool_pre_ping,
+    )
+
+    if make_url(dsn).get_driver_name() == "asyncpg":
+        connect_args: dict[str, Any] = {
+            "prepared_statement_cache_size": config.db_statement_cache_size,
+            "server_settings": {
+                # UtcDateTime(timestamptz) 값을 세션 타임존 변환 없이 주고받는다.
+                "timezone": "UTC",
+                # 짧은 OLTP 쿼리(JSONB 포함)에서는 JIT 컴파일 비용이 이득보다 크다.
+                "jit": "off",
+                "application_name": "fastapi-meeting-service",
+            },
+        }
+        if config.db_statement_cache_size == 0:
+            # PgBouncer transaction 모드에서는 서버측 prepared statement 를 쓸 수 없다.
+            connect_args["statement_cache_size"] = 0
+        options["connect_args"] = connect_args
+
+    return options
+
+
+def create_engine(dsn: str | None = None, config: Settings = settings) -> AsyncEngine:
+    if dsn is None:
+        dsn = config.db_dsn
+
+    return create_async_engine(dsn, **build_engine_options(dsn, config))
+
+
+def configure_sqlite_connection(async_engine: AsyncEngine, config: Settings, *, writer: bool) -> None:
+    """커넥션이 열릴 때마다 PRAGMA 를 적용하고, 트랜잭션 시작 방식을 직접 정한다."""
+
+    @event.listens_for(async_engine.sync_engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        # 드라이버의 암묵적 BEGIN 을 끄고 아래 begin 이벤트에서 직접 보낸다.
+        dbapi_connection.isolation_level = None
+
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA mmap_size={int(config.db_sqlite_mmap_size)}")
+        cursor.execute(f"PRAGMA cache_size={int(config.db_sqlite_cache_size)}")
+        cursor.execute(f"PRAGMA busy_timeout={int(config.db_sqlite_busy_timeout_ms)}")
+        if not writer:
+            cursor.execute("PRAGMA query_only=ON")
+        cursor.close()
+
+    @event.listens_for(async_engine.sync_engine, "begin")
+    def on_begin(conn):
+        # 쓰기 트랜잭션은 처음부터 RESERVED 락을 잡아서 읽기->쓰기 승격 중 SQLITE_BUSY 를 피한다.
+        conn.exec_driver_sql("BEGIN IMMEDIATE" if writer else "BEGIN")
+
+
+def create_sqlite_engines(dsn: str, config: Settings = settings) -> tuple[AsyncEngine, AsyncEngine]:
+    """(쓰기 엔진, 읽기 엔진) 을 만든다.
+
+    쓰기 엔진은 커넥션이 1개뿐이라 쓰기 트랜잭션이 풀 대기열에서 한 줄로 선다.
+    WAL 모드에서는 읽기 커넥션이 쓰기와 상관없이 커밋된 데이터를 바로 본다.
+    """
+    options = build_engine_options(dsn, config)
+
+    writer = create_async_engine(dsn, **{**options, "pool_size": 1, "max_overflow": 0})
+    configure_sqlite_connection(writer, config, writer=True)
+
+    reader = create_async_engine(
         dsn,
-        echo=False,
+        **{**options, "pool_size": config.db_sqlite_read_pool_size, "max_overflow": 0},
     )
+    configure_sqlite_connection(reader, config, writer=False)
+
+    return writer, reader
 
 
 def create_session(async_engine: AsyncEngine | None = None):
@@ -28,15 +135,53 @@ def create_session(async_engine: AsyncEngine | None = None):
     )
 
 
-async def use_session():
-    async with async_session_factory() as session:
+READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+READ_YOUR_WRITES_COOKIE_NAME = "db_primary_until"
+
+
+def is_within_read_your_writes_window(request: Request, now: float) -> bool:
+    """직전 쓰기 요청에서 받은 쿠키의 만료 시각이 아직 지나지 않았는지 확인한다."""
+    try:
+        return float(request.cookies[READ_YOUR_WRITES_COOKIE_NAME]) > now
+    except (KeyError, ValueError):
+        return False
+
+
+async def use_session(request: Request, response: Response):
+    session_factory = async_session_factory
+
+    if replica_session_factory is not None:
+        now = time.time()
+        if request.method in READ_ONLY_METHODS:
+            # 복제 지연 때문에 방금 쓴 데이터가 안 보이는 일이 없도록 창 안에서는 primary 를 쓴다.
+            if not is_within_read_your_writes_window(request, now):
+                session_factory = replica_session_factory
+        elif read_your_writes_seconds > 0:
+            response.set_cookie(
+                key=READ_YOUR_WRITES_COOKIE_NAME,
+                value=f"{now + read_your_writes_seconds:.3f}",
+                max_age=math.ceil(read_your_writes_seconds),
+                httponly=True,
+                samesite="lax",
+            )
+
+    async with session_factory() as session:
         yield session
 
 DbSessionDep = Annotated[AsyncSession, Depends(use_session)]
 
 
-DSN = "sqlite+aiosqlite:///./local.db"
+DSN = settings.db_dsn
+
+if settings.db_sqlite_concurrent and is_sqlite_dsn(DSN) and not is_sqlite_memory_dsn(DSN):
+    # 같은 파일을 읽으므로 복제 지연이 없다.
+    engine, replica_engine = create_sqlite_engines(DSN)
+    read_your_writes_seconds = 0.0
+else:
+    engine = create_engine(DSN)
+    replica_engine = create_engine(settings.db_replica_dsn) if settings.db_replica_dsn else None
+    read_your_writes_seconds = settings.db_read_your_writes_seconds if replica_engine is not None else 0.0
 
-engine = create_engine(DSN)
+async_session_factory = create_session(engine)
 
-async_session_factory = create_session(engine)
\ No newline at end of file
+replica_session_factory = create_session(replica_engine) if replica_engine is not None else None
@@ -0,0 +1,67 @@
+import base64
+import json
+from datetime import date, datetime, timezone
+from typing import Any, Sequence
+
+from sqlalchemy import String
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy_utc import UtcDateTime
+
+
+def encode_cursor(values: Sequence[date | datetime | int | str]) -> str:
+    """
+    정렬 키 값을 클라이언트에게 넘겨줄 불투명한(opaque) 커서 문자열로 만든다.
+
+    >>> encode_cursor([date(2025, 1, 21), 3])
+    'WyIyMDI1LTAxLTIxIiwzXQ'
+    >>> decode_cursor(encode_cursor([date(2025, 1, 21), 3]))
+    ['2025-01-21', 3]
+    """
+    payload = [value.isoformat() if isinstance(value, (date, datetime)) else value for value in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    """
+    커서 문자열을 JSON 배열로 되돌린다. 형식이 잘못되면 ValueError 를 낸다.
+
+    >>> decode_cursor("not-a-cursor")
+    Traceback (most recent call last):
+    ...
+    ValueError: 잘못된 커서입니다.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise ValueError("잘못된 커서입니다.") from exc
+
+    if not isinstance(values, list):
+        raise ValueError("잘못된 커서입니다.")
+    return values
+
+
+class KeysetDateTime(TypeDecorator):
+    """커서에 담긴 시각을 keyset 비교용으로 바인딩하는 타입
+
+    SQLite 는 시각을 문자열로 비교하는데, ``server_default=func.now()`` 로 채워진 값은
+    ``CURRENT_TIMESTAMP`` 형식(초 단위)으로 저장된다. 보통 바인딩하면 마이크로초가 붙어서
+    같은 시각도 다르게 비교되므로, 마이크로초가 0 이면 저장 형식과 똑같이 맞춘다.
+    """
+
+    impl = UtcDateTime
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "sqlite":
+            return dialect.type_descriptor(String())
+        return dialect.type_descriptor(UtcDateTime())
+
+    def process_bind_param(self, value, dialect):
+        if value is None or dialect.name != "sqlite":
+            return value
+        value = value.astimezone(timezone.utc)
+        if value.microsecond:
+            return value.strftime("%Y-%m-%d %H:%M:%S.%f")
+        return value.strftime("%Y-%m-%d %H:%M:%S")
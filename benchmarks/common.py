@@ -0,0 +1,183 @@
+"""벤치마크 공용 도구
+
+벤치마크는 테스트와 달리 실제 엔진(파일 SQLite, PostgreSQL 등)에 붙어서 실행한다.
+각 스크립트는 저장소 루트에서 ``python -m benchmarks.<이름>`` 으로 실행한다.
+"""
+import asyncio
+import statistics
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import date, time as dt_time, timedelta
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+from sqlmodel import SQLModel
+
+from appserver.app import include_routers
+from appserver.db import use_session
+from appserver.apps.account.models import User
+from appserver.apps.account.utils import hash_password, create_access_token
+from appserver.apps.account.constants import AUTH_TOKEN_COOKIE_NAME
+from appserver.apps.calendar.models import Calendar, TimeSlot, Booking
+
+BENCH_PASSWORD = "benchmark-password"
+HOST_USERNAME = "bench_host"
+
+
+@dataclass
+class Seeded:
+    host: User
+    calendar: Calendar
+    time_slot: TimeSlot
+    guests: list[User]
+
+
+@dataclass
+class LoadResult:
+    name: str
+    latencies: list[float] = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+    elapsed: float = 0.0
+
+    @property
+    def rps(self) -> float:
+        return len(self.latencies) / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, p: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def summary(self) -> str:
+        mean = statistics.fmean(self.latencies) if self.latencies else 0.0
+        return (
+            f"{self.name:<40} {self.rps:>9.1f} req/s  "
+            f"mean {mean * 1000:>7.2f}ms  p50 {self.percentile(50) * 1000:>7.2f}ms  "
+            f"p99 {self.percentile(99) * 1000:>7.2f}ms  status {dict(self.statuses)}"
+        )
+
+
+def make_app(session_factory: async_sessionmaker | None = None) -> FastAPI:
+    """session_factory 를 주면 그 세션만 쓰고, 없으면 ``appserver.db`` 의 라우팅을 그대로 쓴다."""
+    app = FastAPI()
+    include_routers(app)
+    if session_factory is None:
+        return app
+
+    async def override_use_session():
+        async with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[use_session] = override_use_session
+    return app
+
+
+def make_client(app: FastAPI) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench")
+
+
+def auth_headers(user: User) -> dict[str, str]:
+    token = create_access_token({"sub": user.username, "is_host": user.is_host})
+    return {"Cookie": f"{AUTH_TOKEN_COOKIE_NAME}={token}"}
+
+
+async def reset_schema(engine: AsyncEngine) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.drop_all)
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+
+async def seed(
+    session_factory: async_sessionmaker,
+    guest_count: int = 20,
+    bookings_per_guest: int = 0,
+    start: date | None = None,
+) -> Seeded:
+    """호스트 1명, 모든 요일에 열린 타임슬롯 1개, 게스트 N명과 예약을 만든다."""
+    hashed_password = hash_password(BENCH_PASSWORD)
+    start = start or date.today() + timedelta(days=1)
+
+    async with session_factory() as session:
+        host = User(
+            username=HOST_USERNAME,
+            email=f"{HOST_USERNAME}@example.com",
+            display_name="benchmark host",
+            hashed_password=hashed_password,
+            is_host=True,
+        )
+        guests = [
+            User(
+                username=f"bench_guest_{index}",
+                email=f"bench_guest_{index}@example.com",
+                display_name=f"guest {index}",
+                hashed_password=hashed_password,
+            )
+            for index in range(guest_count)
+        ]
+        session.add(host)
+        session.add_all(guests)
+        await session.flush()
+
+        calendar = Calendar(
+            host_id=host.id,
+            topics=["benchmark"],
+            description="benchmark calendar",
+            google_calendar_id="bench@example.com",
+        )
+        session.add(calendar)
+        await session.flush()
+
+        time_slot = TimeSlot(
+            calendar_id=calendar.id,
+            start_time=dt_time(9, 0),
+            end_time=dt_time(10, 0),
+            weekdays=list(range(7)),
+        )
+        session.add(time_slot)
+        await session.flush()
+
+        for guest in guests:
+            session.add_all(
+                Booking(
+                    when=start + timedelta(days=offset),
+                    topic="benchmark",
+                    description="benchmark",
+                    time_slot_id=time_slot.id,
+                    guest_id=guest.id,
+                )
+                for offset in range(bookings_per_guest)
+            )
+        await session.commit()
+
+    return Seeded(host=host, calendar=calendar, time_slot=time_slot, guests=guests)
+
+
+async def run_load(
+    name: str,
+    request: Callable[[int], Awaitable[httpx.Response]],
+    total: int,
+    concurrency: int,
+) -> LoadResult:
+    """``request(i)`` 를 total 번, 최대 concurrency 개씩 동시에 실행한다."""
+    result = LoadResult(name=name)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(index: int) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                response = await request(index)
+                result.statuses[response.status_code] += 1
+            except Exception as exc:  # 벤치마크는 실패도 집계만 하고 계속 진행한다.
+                result.statuses[type(exc).__name__] += 1
+            result.latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(index) for index in range(total)))
+    result.elapsed = time.perf_counter() - started
+    return result
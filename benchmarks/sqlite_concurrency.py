@@ -0,0 +1,78 @@
+"""SQLite 동시성 모드 전후의 지연 시간(p99)을 비교한다.
+
+    python -m benchmarks.sqlite_concurrency --path ./bench_sqlite.db
+
+예약 생성(쓰기)과 캘린더/사용자 조회(읽기)를 섞어서 동시에 보낸다.
+기본 모드는 커넥션 풀 하나를 읽기/쓰기가 나눠 쓰고, 동시성 모드는
+WAL + 쓰기 전용 커넥션 1개 + 읽기 전용 커넥션 풀을 쓴다.
+"""
+import argparse
+import asyncio
+import os
+from datetime import date, timedelta
+
+from appserver import db
+from appserver.db import create_engine, create_session, create_sqlite_engines
+
+from .common import HOST_USERNAME, auth_headers, make_app, make_client, reset_schema, run_load, seed
+
+
+async def bench_mode(name: str, path: str, total: int, concurrency: int) -> None:
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+    dsn = f"sqlite+aiosqlite:///{path}"
+    if name == "concurrent":
+        writer, reader = create_sqlite_engines(dsn)
+    else:
+        writer = reader = create_engine(dsn)
+
+    db.async_session_factory = create_session(writer)
+    db.replica_session_factory = create_session(reader) if reader is not writer else None
+    db.read_your_writes_seconds = 0.0
+
+    await reset_schema(writer)
+    seeded = await seed(db.async_session_factory, guest_count=concurrency)
+    guest_headers = [auth_headers(guest) for guest in seeded.guests]
+    first_day = date.today() + timedelta(days=1)
+
+    async def mixed(i: int):
+        headers = guest_headers[i % len(guest_headers)]
+        if i % 4 == 0:
+            return await client.post(
+                f"/bookings/{HOST_USERNAME}",
+                json={
+                    "when": (first_day + timedelta(days=i // len(guest_headers))).isoformat(),
+                    "topic": "benchmark",
+                    "description": "benchmark",
+                    "time_slot_id": seeded.time_slot.id,
+                },
+                headers=headers,
+            )
+        if i % 2 == 0:
+            return await client.get(f"/calendar/{HOST_USERNAME}", headers=headers)
+        return await client.get(f"/account/users/{HOST_USERNAME}")
+
+    async with make_client(make_app()) as client:
+        result = await run_load(f"{name} (25% writes)", mixed, total, concurrency)
+
+    await writer.dispose()
+    if reader is not writer:
+        await reader.dispose()
+    print(result.summary())
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--path", default="./bench_sqlite.db")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args()
+
+    for name in ("default", "concurrent"):
+        await bench_mode(name, args.path, args.requests, args.concurrency)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,116 @@
+from datetime import date
+
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from appserver.apps.account.models import User
+from appserver.apps.calendar.models import Booking, TimeSlot
+
+
+def fetch_all_pages(client: TestClient, url: str, page_size: int) -> list[list[dict]]:
+    pages = []
+    params = {"page_size": page_size}
+    while True:
+        response = client.get(url, params=params)
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        pages.append(data["items"])
+        if data["next_cursor"] is None:
+            return pages
+        params = {"page_size": page_size, "cursor": data["next_cursor"]}
+
+
+async def test_게스트는_커서로_예약_목록을_끝까지_중복_없이_가져온다(
+    client_with_guest_auth: TestClient,
+    host_bookings: list[Booking],
+):
+    pages = fetch_all_pages(client_with_guest_auth, "/guest-calendar/bookings", page_size=3)
+
+    assert [len(page) for page in pages] == [3, 1]
+    items = [item for page in pages for item in page]
+    assert [item["id"] for item in items] == [booking.id for booking in reversed(host_bookings)]
+
+
+async def test_페이지를_넘기는_사이에_예약이_추가되어도_다음_페이지가_밀리지_않는다(
+    client_with_guest_auth: TestClient,
+    db_session: AsyncSession,
+    guest_user: User,
+    time_slot_tuesday: TimeSlot,
+    host_bookings: list[Booking],
+):
+    response = client_with_guest_auth.get("/guest-calendar/bookings", params={"page_size": 2})
+    first_page = response.json()
+
+    db_session.add(Booking(
+        when=date(2025, 3, 4),
+        topic="새 예약",
+        description="새 예약",
+        time_slot_id=time_slot_tuesday.id,
+        guest_id=guest_user.id,
+    ))
+    await db_session.commit()
+
+    response = client_with_guest_auth.get(
+        "/guest-calendar/bookings",
+        params={"page_size": 2, "cursor": first_page["next_cursor"]},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    second_page = response.json()
+    assert [item["id"] for item in second_page["items"]] == [host_bookings[1].id, host_bookings[0].id]
+    assert second_page["next_cursor"] is None
+
+
+async def test_호스트는_커서로_자신의_캘린더_예약_목록을_가져온다(
+    client_with_auth: TestClient,
+    host_bookings: list[Booking],
+):
+    pages = fetch_all_pages(client_with_auth, "/bookings", page_size=2)
+
+    assert [len(page) for page in pages] == [2, 2]
+    whens = [item["when"] for page in pages for item in page]
+    assert whens == sorted(whens, reverse=True)
+
+
+async def test_page_를_지정하면_예전처럼_목록으로_응답한다(
+    client_with_guest_auth: TestClient,
+    host_bookings: list[Booking],
+):
+    response = client_with_guest_auth.get("/guest-calendar/bookings", params={"page": 2, "page_size": 3})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [item["id"] for item in response.json()] == [host_bookings[0].id]
+
+
+async def test_잘못된_커서로_요청하면_HTTP_422_응답을_한다(
+    client_with_guest_auth: TestClient,
+):
+    response = client_with_guest_auth.get("/guest-calendar/bookings", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_날짜와_생성_시각이_같은_예약도_커서로_빠짐없이_가져온다(
+    client_with_guest_auth: TestClient,
+    db_session: AsyncSession,
+    guest_user: User,
+    time_slot_tuesday: TimeSlot,
+):
+    bookings = [
+        Booking(
+            when=date(2025, 1, 21),
+            topic=f"같은 날 예약 {index}",
+            description="test",
+            time_slot_id=time_slot_tuesday.id,
+            guest_id=guest_user.id,
+        )
+        for index in range(5)
+    ]
+    db_session.add_all(bookings)
+    await db_session.commit()
+
+    pages = fetch_all_pages(client_with_guest_auth, "/guest-calendar/bookings", page_size=2)
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert [item["id"] for page in pages for item in page] == [booking.id for booking in reversed(bookings)]
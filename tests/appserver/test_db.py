@@ -0,0 +1,131 @@
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI, status
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlmodel import SQLModel
+
+from appserver import db
+from appserver.app import include_routers
+from appserver.apps.account.models import User
+from appserver.db import READ_YOUR_WRITES_COOKIE_NAME, create_engine, create_session, create_sqlite_engines
+
+
+@pytest.fixture()
+async def primary_and_replica(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    """primary 와 replica 를 별도의 SQLite 파일로 띄운다. replica 에만 있는 사용자를 하나 넣어 둔다."""
+    primary_engine = create_engine(f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}")
+    replica_engine = create_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+    for engine in (primary_engine, replica_engine):
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+
+    replica_session_factory = create_session(replica_engine)
+    async with replica_session_factory() as session:
+        session.add(User(
+            username="replica_only",
+            email="replica_only@example.com",
+            display_name="복제본 사용자",
+            hashed_password="not-a-real-hash",
+        ))
+        await session.commit()
+
+    monkeypatch.setattr(db, "async_session_factory", create_session(primary_engine))
+    monkeypatch.setattr(db, "replica_session_factory", replica_session_factory)
+    monkeypatch.setattr(db, "read_your_writes_seconds", 5.0)
+    yield
+
+    await primary_engine.dispose()
+    await replica_engine.dispose()
+
+
+@pytest.fixture()
+async def routed_client(primary_and_replica):
+    app = FastAPI()
+    include_routers(app)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+async def test_GET_요청은_복제본_세션을_사용한다(routed_client: httpx.AsyncClient):
+    response = await routed_client.get("/account/users/replica_only")
+
+    assert response.status_code == status.HTTP_200_OK
+
+
+async def test_쓰기_요청_직후의_GET_요청은_primary_세션을_사용한다(routed_client: httpx.AsyncClient):
+    payload = {
+        "username": "primary_user",
+        "email": "primary_user@example.com",
+        "display_name": "primary 사용자",
+        "password": "testtest",
+        "password_again": "testtest",
+    }
+    response = await routed_client.post("/account/signup", json=payload)
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.cookies.get(READ_YOUR_WRITES_COOKIE_NAME) is not None
+
+    # 쿠키가 살아 있는 동안은 방금 쓴 primary 에서 읽는다.
+    response = await routed_client.get("/account/users/primary_user")
+    assert response.status_code == status.HTTP_200_OK
+
+    response = await routed_client.get("/account/users/replica_only")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+async def test_읽기_우선_창이_지나면_다시_복제본을_사용한다(routed_client: httpx.AsyncClient):
+    routed_client.cookies.set(READ_YOUR_WRITES_COOKIE_NAME, "0")
+
+    response = await routed_client.get("/account/users/replica_only")
+
+    assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.fixture()
+async def sqlite_engines(tmp_path):
+    writer, reader = create_sqlite_engines(f"sqlite+aiosqlite:///{tmp_path / 'concurrent.db'}")
+    async with writer.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    yield writer, reader
+    await writer.dispose()
+    await reader.dispose()
+
+
+async def test_SQLite_동시성_모드는_WAL_과_PRAGMA_를_적용한다(sqlite_engines):
+    writer, reader = sqlite_engines
+
+    async with reader.connect() as conn:
+        assert (await conn.execute(text("PRAGMA journal_mode"))).scalar_one() == "wal"
+        assert (await conn.execute(text("PRAGMA synchronous"))).scalar_one() == 1  # NORMAL
+        assert (await conn.execute(text("PRAGMA busy_timeout"))).scalar_one() == 5000
+
+
+async def test_SQLite_동시성_모드의_읽기_커넥션은_쓰기를_거부한다(sqlite_engines):
+    writer, reader = sqlite_engines
+
+    async with reader.connect() as conn:
+        with pytest.raises(OperationalError):
+            await conn.execute(text("DELETE FROM users"))
+
+
+async def test_SQLite_동시성_모드에서_동시_쓰기는_잠금_오류_없이_순서대로_처리된다(sqlite_engines):
+    writer, reader = sqlite_engines
+    session_factory = create_session(writer)
+
+    async def signup(index: int):
+        async with session_factory() as session:
+            session.add(User(
+                username=f"concurrent_{index}",
+                email=f"concurrent_{index}@example.com",
+                display_name=f"동시 사용자 {index}",
+                hashed_password="not-a-real-hash",
+            ))
+            await session.commit()
+
+    await asyncio.gather(*(signup(index) for index in range(50)))
+
+    async with reader.connect() as conn:
+        assert (await conn.execute(text("SELECT count(*) FROM users"))).scalar_one() == 50
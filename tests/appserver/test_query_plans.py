@@ -0,0 +1,174 @@
+"""엔드포인트가 실제로 실행하는 SQL 의 실행 계획을 검사한다.
+
+SQLite 는 ``EXPLAIN QUERY PLAN`` 으로, PostgreSQL 은 ``enable_seqscan = off`` 상태의
+``EXPLAIN`` 으로 확인해서 테이블 전체 스캔이 하나라도 있으면 실패한다.
+PostgreSQL 검사는 ``TEST_POSTGRES_DSN`` 환경 변수가 있을 때만 실행한다.
+"""
+import os
+import re
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import SQLModel
+
+from appserver.db import create_engine, create_session
+from appserver.apps.account.models import User
+from appserver.apps.calendar.models import Booking, TimeSlot
+
+TABLE_SCAN_PATTERNS = {
+    # "SCAN bookings" 는 전체 스캔, "SCAN bookings USING INDEX ..." 는 인덱스 스캔
+    "sqlite": re.compile(r"^SCAN (?!CONSTANT ROW)\S+$"),
+    "postgresql": re.compile(r"Seq Scan on \S+"),
+}
+
+
+@pytest.fixture(params=["sqlite", "postgresql"])
+async def db_session(request: pytest.FixtureRequest):
+    if request.param == "sqlite":
+        dsn = "sqlite+aiosqlite:///:memory:"
+    else:
+        dsn = os.getenv("TEST_POSTGRES_DSN")
+        if not dsn:
+            pytest.skip("TEST_POSTGRES_DSN 이 없어서 PostgreSQL 실행 계획 검사를 건너뜁니다.")
+
+    engine = create_engine(dsn)
+    async with engine.connect() as conn:
+        await conn.run_sync(SQLModel.metadata.drop_all)
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+        session_factory = create_session(conn)
+        async with session_factory() as session:
+            yield session
+
+        await conn.rollback()
+
+    await engine.dispose()
+
+
+async def explain(session: AsyncSession, statement: str, parameters) -> list[str]:
+    conn = await session.connection()
+    if conn.dialect.name == "sqlite":
+        result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        return [row[-1] for row in result]
+
+    await conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+    result = await conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+    return [row[0] for row in result]
+
+
+async def assert_no_table_scan(session: AsyncSession, statements: list[tuple[str, object]]) -> None:
+    captured = list(statements)
+    statements.clear()
+
+    dialect = (await session.connection()).dialect.name
+    pattern = TABLE_SCAN_PATTERNS[dialect]
+
+    checked = set()
+    for statement, parameters in captured:
+        if not statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE")):
+            continue
+        if statement in checked:
+            continue
+        checked.add(statement)
+
+        plan = await explain(session, statement, parameters)
+        scans = [line for line in plan if pattern.search(line.strip())]
+        assert not scans, f"테이블 전체 스캔: {scans}\n{statement}\n" + "\n".join(plan)
+
+    statements.clear()
+    assert checked, "검사할 SQL 이 실행되지 않았습니다."
+
+
+async def test_계정_API_의_쿼리는_인덱스를_사용한다(
+    client: TestClient,
+    db_session: AsyncSession,
+    sql_statements: list,
+):
+    payload = {
+        "username": "plan_user",
+        "email": "plan_user@example.com",
+        "display_name": "실행 계획",
+        "password": "testtest",
+        "password_again": "testtest",
+    }
+    assert client.post("/account/signup", json=payload).status_code == status.HTTP_201_CREATED
+
+    response = client.post("/account/login", json={"username": "plan_user", "password": "testtest"})
+    assert response.status_code == status.HTTP_200_OK
+    client.cookies.set("auth_token", response.cookies.get("auth_token"))
+
+    assert client.get("/account/users/plan_user").status_code == status.HTTP_200_OK
+    assert client.get("/account/@me").status_code == status.HTTP_200_OK
+    assert client.patch("/account/@me", json={"display_name": "변경된 이름"}).status_code == status.HTTP_200_OK
+    assert client.delete("/account/unregister").status_code == status.HTTP_204_NO_CONTENT
+
+    await assert_no_table_scan(db_session, sql_statements)
+
+
+@pytest.mark.usefixtures("host_user_calendar")
+async def test_캘린더와_타임슬롯_API_의_쿼리는_인덱스를_사용한다(
+    host_user: User,
+    client: TestClient,
+    client_with_auth: TestClient,
+    db_session: AsyncSession,
+    sql_statements: list,
+):
+    assert client.get(f"/calendar/{host_user.username}").status_code == status.HTTP_200_OK
+    assert client_with_auth.get(f"/calendar/{host_user.username}").status_code == status.HTTP_200_OK
+
+    payload = {"start_time": "10:00", "end_time": "11:00", "weekdays": [0, 2]}
+    assert client_with_auth.post("/time-slots", json=payload).status_code == status.HTTP_201_CREATED
+    response = client_with_auth.patch("/calendar", json={"description": "실행 계획 검사용 설명입니다."})
+    assert response.status_code == status.HTTP_200_OK
+
+    await assert_no_table_scan(db_session, sql_statements)
+
+
+async def test_예약_생성과_조회_API_의_쿼리는_인덱스를_사용한다(
+    host_user: User,
+    time_slot_tuesday: TimeSlot,
+    host_bookings: list[Booking],
+    client_with_auth: TestClient,
+    client_with_guest_auth: TestClient,
+    db_session: AsyncSession,
+    sql_statements: list,
+):
+    payload = {
+        "when": "2025-02-18",
+        "topic": "실행 계획",
+        "description": "실행 계획",
+        "time_slot_id": time_slot_tuesday.id,
+    }
+    response = client_with_guest_auth.post(f"/bookings/{host_user.username}", json=payload)
+    assert response.status_code == status.HTTP_201_CREATED
+
+    responses = [
+        client_with_auth.get("/bookings", params={"page": 1, "page_size": 10}),
+        client_with_guest_auth.get("/guest-calendar/bookings", params={"page": 1, "page_size": 10}),
+        client_with_guest_auth.get(f"/calendar/{host_user.username}/bookings", params={"year": 2025, "month": 1}),
+        client_with_auth.get(f"/bookings/{host_bookings[0].id}"),
+        client_with_guest_auth.get(f"/bookings/{host_bookings[0].id}"),
+    ]
+    assert all(response.status_code == status.HTTP_200_OK for response in responses)
+
+    await assert_no_table_scan(db_session, sql_statements)
+
+
+async def test_예약_변경_API_의_쿼리는_인덱스를_사용한다(
+    host_bookings: list[Booking],
+    client_with_auth: TestClient,
+    client_with_guest_auth: TestClient,
+    db_session: AsyncSession,
+    sql_statements: list,
+):
+    responses = [
+        client_with_auth.patch(f"/bookings/{host_bookings[0].id}", json={"when": "2025-02-18"}),
+        client_with_auth.patch(f"/bookings/{host_bookings[1].id}/status", json={"attendance_status": "attended"}),
+        client_with_guest_auth.patch(f"/guest-bookings/{host_bookings[2].id}", json={"topic": "변경"}),
+        client_with_guest_auth.delete(f"/guest-bookings/{host_bookings[3].id}"),
+    ]
+    assert all(response.status_code == status.HTTP_200_OK for response in responses)
+
+    await assert_no_table_scan(db_session, sql_statements)
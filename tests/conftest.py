@@ -5,6 +5,7 @@ import os
 from fastapi import FastAPI, status
 from fastapi.testclient import TestClient
 import pytest
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import SQLModel
 
@@ -39,6 +40,20 @@ async def db_session():
     await engine.dispose()
 
 
+@pytest.fixture()
+def sql_statements(db_session: AsyncSession):
+    """실행되는 SQL 문장과 파라미터를 순서대로 모은다."""
+    statements: list[tuple[str, object]] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    sync_engine = db_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
 @pytest.fixture()
 def fastapi_app(db_session: AsyncSession):
     app = FastAPI()